@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, NamedTuple
 
-from PySide6.QtCore import QObject, Signal, QThread, Slot
+from PySide6.QtCore import QObject, Signal, QThread, Slot, Qt, QSettings, QTimer
 
+import collections
 import json
+import os
+import queue
+import select
+import struct
+import sys
 import time
 import threading
 
@@ -16,12 +23,65 @@ except Exception:
     serial = None
     list_ports = None
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+try:
+    import fcntl
+except Exception:  # not available on Windows
+    fcntl = None
+
 from reportlab.pdfgen import canvas
 
 
+# Linux <linux/serial.h>: struct serial_struct, its 'flags' field offset and ASYNC_LOW_LATENCY
+_TIOCGSERIAL = 0x541E
+_TIOCSSERIAL = 0x541F
+_SERIAL_STRUCT_SIZE = 0x60   # >= sizeof(struct serial_struct) on 32/64-bit
+_SERIAL_FLAGS_OFFSET = 16
+_ASYNC_LOW_LATENCY = 0x2000
+
+# macOS <IOKit/serial/ioss.h>: IOSSDATALAT = _IOW('T', 0, unsigned long), in microseconds
+_IOSSDATALAT = 0x80085400
+_DATA_LATENCY_US = 1000
+
+# USB vendor IDs of the serial chips/boards printers ship with: CH340, FTDI,
+# Arduino, SiLabs CP210x, Raspberry Pi (RP2040), STMicro, Prusa, OpenMoko (Marlin boards)
+_PRINTER_VIDS = frozenset({0x1A86, 0x0403, 0x2341, 0x10C4, 0x2E8A, 0x0483, 0x2C99, 0x1D50})
+# device names of USB serial adapters (Linux / macOS), for ports reported without a VID
+_PRINTER_PORT_NAMES = ("ttyACM", "ttyUSB", "usbmodem", "usbserial")
+
+# Upper bound for the send window: Marlin's BUFSIZE is configurable but rarely
+# above 16, and more unacknowledged lines than that overflow its RX ring.
+_WINDOW_MAX = 16
+
+# Static blocks of the drawing run, written with one write each.
+_CUSTOM_HEADER = b"M220 S100\nM302 S0\nM221 S100\nG90\nM82\nG1 Z2 F1500\nG92 E0\n"
+_CUSTOM_FOOTER = b"M300 S440 P200\nG0 X10 Y190 Z30 F3000\n"
+
+# Encoded command lines, filled lazily by the single-line senders
+# (_send_window, _send_and_wait_ok). Bounded so per-fiber coordinate moves
+# (all distinct) cannot grow it without limit; in practice the first fibers'
+# moves fill the slots and later misses are encoded on each send. The static
+# header and footer never pass through here: _send_bulk writes them as blobs.
+_CMD_BYTES: Dict[str, bytes] = {}
+_CMD_BYTES_MAX = 256
+
+
+def _cmd_bytes(cmd: str) -> bytes:
+    data = _CMD_BYTES.get(cmd)
+    if data is None:
+        data = (cmd + "\n").encode("utf-8")
+        if len(_CMD_BYTES) < _CMD_BYTES_MAX:
+            _CMD_BYTES[cmd] = data
+    return data
+
+
 # ----------------------------- Data Model -----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Params:
     # --- Mode ---
     # Legacy: usa a lógica antiga (cups + orientation Horizontal/Vertical/Both)
@@ -44,14 +104,14 @@ class Params:
     syringe_droplet_units: int = 5
 
     # --- CustomCentered safe bounds (seu retângulo seguro) ---
-    safe_x_min: float = 0
-    safe_x_max: float = 170
+    safe_x_min: float = 0.0
+    safe_x_max: float = 170.0
     safe_y_min: float = 20.0
     safe_y_max: float = 250.0
 
     # --- Rectangle anchor (bottom-left corner of draw rectangle) ---
-    start_x: float = 0
-    start_y: float = 0
+    start_x: float = 0.0
+    start_y: float = 0.0
     # --- CustomCentered parameters ---
     fiber_orientation: str = "Horizontal"  # Horizontal | Vertical
     fiber_length: float = 80.0            # L (mm)
@@ -59,76 +119,223 @@ class Params:
     fiber_spacing: float = 1.0            # S (mm) distância entre fibras
 
 
+# Project file schema: (JSON key, Params attribute, cast), in file order.
+_FIELD_SPEC: tuple[tuple[str, str, type], ...] = (
+    ("Speed", "speed", int),
+    ("Droplet Amount", "droplet_amount", float),
+    ("Z-Hop", "z_hop", float),
+    ("Pause (ms)", "pause_ms", int),
+    ("Z-Offset", "z_offset", float),
+    ("Afterdrop", "afterdrop", bool),
+    ("Clean", "clean", bool),
+
+    ("Syringe Current Amount", "syringe_current_amount", float),
+    ("Syringe Droplet Units", "syringe_droplet_units", int),
+
+    ("Safe X Min", "safe_x_min", float),
+    ("Safe X Max", "safe_x_max", float),
+    ("Safe Y Min", "safe_y_min", float),
+    ("Safe Y Max", "safe_y_max", float),
+
+    ("Start X", "start_x", float),
+    ("Start Y", "start_y", float),
+
+    ("Fiber Orientation", "fiber_orientation", str),
+    ("Fiber Length", "fiber_length", float),
+    ("Fiber Width", "fiber_width", float),
+    ("Fiber Spacing", "fiber_spacing", float),
+)
+
+# Params attribute -> cast; set_param coerces with it, so stored values
+# always have the declared type
+_FIELD_CAST: Dict[str, type] = {attr: cast for _, attr, cast in _FIELD_SPEC}
+
+
+class _ParamsSnapshot(NamedTuple):
+    """Per-fiber copy of the live drawing params."""
+    orient: str
+    length: float
+    width: float
+    spacing: float
+    start_x: float
+    start_y: float
+    speed: int
+    z_offset: float
+    z_hop: float
+    pause_ms: int
+    droplet: float
+    afterdrop: bool
+    clean: bool
+
+
+def _snap(p: Params) -> _ParamsSnapshot:
+    return _ParamsSnapshot(
+        p.fiber_orientation,
+        p.fiber_length,
+        p.fiber_width,
+        p.fiber_spacing,
+        p.start_x,
+        p.start_y,
+        p.speed,
+        p.z_offset,
+        p.z_hop,
+        p.pause_ms,
+        p.droplet_amount,
+        p.afterdrop,
+        p.clean,
+    )
+
+
+def _anchored_rect_core(
+    length: float,
+    width: float,
+    horizontal: bool,
+    start_x: float,
+    start_y: float,
+    x_min: float,
+    x_max: float,
+    y_min: float,
+    y_max: float,
+) -> tuple[float, float, float, float, bool]:
+    """
+    Pure arithmetic behind MachineController._compute_anchored_rect.
+    Returns (x0, x1, y0, y1, inside) instead of raising, so callers that
+    only need the geometry (or a validity flag) skip the exception path.
+    """
+    start_y += 20
+    # Horizontal: length along X, width along Y; Vertical swaps them
+    dx, dy = (length, width) if horizontal else (width, length)
+    x0, x1 = start_x, start_x + dx
+    y0, y1 = start_y, start_y + dy
+    inside = not (x0 < x_min or x1 > x_max or y0 < y_min or y1 > y_max)
+    return x0, x1, y0, y1, inside
+
+
+def _um(v: float) -> int:
+    """Millimetres -> integer micrometres (the printer cannot resolve finer)."""
+    return int(round(v * 1000.0))
+
+
+def _mm(um: int) -> str:
+    """Integer micrometres -> G-code millimetres with 3 decimals, no float formatting."""
+    if um < 0:
+        return "-%d.%03d" % divmod(-um, 1000)
+    return "%d.%03d" % divmod(um, 1000)
+
+
+def _fiber_path(
+    orient: str, x0: float, x1: float, y0: float, y1: float, spacing: float
+) -> list[tuple[str, str, float]]:
+    """
+    Serpentine path of one layer inside the rectangle (x0, x1, y0, y1).
+    One entry per fiber: (start "X.. Y..", end "X.. Y..", end coordinate
+    along the fiber), alternating direction every fiber.
+    Coordinates are stepped in integer micrometres, so spacing does not
+    accumulate float error across many fibers.
+    """
+    path = []
+    x0, x1, y0, y1, step = _um(x0), _um(x1), _um(y0), _um(y1), _um(spacing)
+    if step <= 0:
+        step = 1
+    if orient == "Horizontal":
+        a, b = _mm(x0), _mm(x1)
+        for i, y in enumerate(range(y0, y1 + 1, step)):
+            ys = _mm(y)
+            if (i % 2) == 0:
+                path.append((f"X{a} Y{ys}", f"X{b} Y{ys}", x1 / 1000.0))
+            else:
+                path.append((f"X{b} Y{ys}", f"X{a} Y{ys}", x0 / 1000.0))
+    else:
+        a, b = _mm(y0), _mm(y1)
+        for i, x in enumerate(range(x0, x1 + 1, step)):
+            xs = _mm(x)
+            if (i % 2) == 0:
+                path.append((f"X{xs} Y{a}", f"X{xs} Y{b}", y1 / 1000.0))
+            else:
+                path.append((f"X{xs} Y{b}", f"X{xs} Y{a}", y0 / 1000.0))
+    return path
+
+
 class AppState(QObject):
     changed = Signal()
     log = Signal(str)
+    _change_scheduled = Signal()  # internal; queued so bursts of changes emit `changed` once
 
     def __init__(self) -> None:
         super().__init__()
         self.params = Params()
 
+        # `changed` is emitted from the event loop at most every 50 ms, once per
+        # burst of set_param calls (also those made from the drawing worker
+        # thread). The queued signal hops to this object's thread, where the
+        # timer is started: a QTimer cannot be started from the worker.
+        self._bulk_depth = 0  # nesting level of batch()
+        self._pending_change = False
+        self._scheduled = False
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(50)
+        self._emit_timer.timeout.connect(self._emit_changed)
+        self._change_scheduled.connect(self._start_emit_timer, Qt.QueuedConnection)
+
     def set_param(self, name: str, value: Any) -> None:
-        if not hasattr(self.params, name):
+        """Set one param, coerced to its declared type (raises ValueError/TypeError right here)."""
+        cast = _FIELD_CAST.get(name)
+        if cast is None:
             raise AttributeError(f"Unknown param: {name}")
-        setattr(self.params, name, value)
-        self.changed.emit()
+        setattr(self.params, name, cast(value))
+        self._mark_changed()
 
-    def to_project_dict(self) -> Dict[str, Any]:
-        p = self.params
-        return {
-            "Speed": int(p.speed),
-            "Droplet Amount": float(p.droplet_amount),
-            "Z-Hop": float(p.z_hop),
-            "Pause (ms)": int(p.pause_ms),
-            "Z-Offset": float(p.z_offset),
-            "Afterdrop": bool(p.afterdrop),
-            "Clean": bool(p.clean),
-
-            "Syringe Current Amount": float(p.syringe_current_amount),
-            "Syringe Droplet Units": int(p.syringe_droplet_units),
-
-            "Safe X Min": float(p.safe_x_min),
-            "Safe X Max": float(p.safe_x_max),
-            "Safe Y Min": float(p.safe_y_min),
-            "Safe Y Max": float(p.safe_y_max),
-
-            "Start X": float(p.start_x),
-            "Start Y": float(p.start_y),
-
-            "Fiber Orientation": str(p.fiber_orientation),
-            "Fiber Length": float(p.fiber_length),
-            "Fiber Width": float(p.fiber_width),
-            "Fiber Spacing": float(p.fiber_spacing),
-        }
-
-    def apply_project_dict(self, data: Dict[str, Any]) -> None:
-        p = self.params
+    def _mark_changed(self) -> None:
+        self._pending_change = True
+        if self._bulk_depth == 0 and not self._scheduled:
+            self._scheduled = True
+            self._change_scheduled.emit()
 
-        p.speed = int(data.get("Speed", p.speed))
-        p.droplet_amount = float(data.get("Droplet Amount", p.droplet_amount))
-        p.z_hop = float(data.get("Z-Hop", p.z_hop))
-        p.pause_ms = int(data.get("Pause (ms)", p.pause_ms))
-        p.z_offset = float(data.get("Z-Offset", p.z_offset))
-        p.afterdrop = bool(data.get("Afterdrop", p.afterdrop))
-        p.clean = bool(data.get("Clean", p.clean))
-
-        p.syringe_current_amount = float(data.get("Syringe Current Amount", p.syringe_current_amount))
-        p.syringe_droplet_units = int(data.get("Syringe Droplet Units", p.syringe_droplet_units))
+    @Slot()
+    def _start_emit_timer(self) -> None:
+        self._emit_timer.start()
 
-        p.safe_x_min = float(data.get("Safe X Min", p.safe_x_min))
-        p.safe_x_max = float(data.get("Safe X Max", p.safe_x_max))
-        p.safe_y_min = float(data.get("Safe Y Min", p.safe_y_min))
-        p.safe_y_max = float(data.get("Safe Y Max", p.safe_y_max))
+    @Slot()
+    def _emit_changed(self) -> None:
+        self._scheduled = False
+        if self._pending_change:
+            self._pending_change = False
+            self.changed.emit()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several set_param calls: `changed` is held back until the
+        outermost block exits, then emitted once.
 
-        p.start_x = float(data.get("Start X", p.start_x))
-        p.start_y = float(data.get("Start Y", p.start_y))
+            with state.batch():
+                state.set_param("fiber_length", 50.0)
+                state.set_param("fiber_width", 20.0)
+        """
+        self._bulk_depth += 1
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0 and self._pending_change:
+                self._mark_changed()
 
-        p.fiber_orientation = str(data.get("Fiber Orientation", p.fiber_orientation))
-        p.fiber_length = float(data.get("Fiber Length", p.fiber_length))
-        p.fiber_width = float(data.get("Fiber Width", p.fiber_width))
-        p.fiber_spacing = float(data.get("Fiber Spacing", p.fiber_spacing))
+    def to_project_dict(self) -> Dict[str, Any]:
+        p = self.params
+        # values are already coerced by set_param / apply_project_dict
+        return {key: getattr(p, attr) for key, attr, _ in _FIELD_SPEC}
 
-        self.changed.emit()
+    def apply_project_dict(self, data: Dict[str, Any]) -> None:
+        p = self.params
+        with self.batch():
+            for key, attr, cast in _FIELD_SPEC:
+                if key not in data:
+                    continue  # keep the current (already typed) value
+                v = data[key]
+                # JSON already decodes most values to the right type
+                setattr(p, attr, v if type(v) is cast else cast(v))
+            self._mark_changed()
 
 # ----------------------------- Drawing Worker -----------------------------
 
@@ -159,17 +366,42 @@ class MachineController(QObject):
     drawing_running_changed = Signal(bool)
     drawing_paused_changed = Signal(bool)
 
-    def __init__(self, state: AppState) -> None:
+    def __init__(self, state: AppState, window: int = 4) -> None:
         super().__init__()
         self.state = state
         self.ser: Optional["serial.Serial"] = None  # type: ignore[name-defined]
+        # device of the last successful connect, kept across app restarts
+        self._settings = QSettings("Microfiber", "MicrofiberController")
+        self._last_port: Optional[str] = self._settings.value("serial/last_port") or None
+
+        # streaming window: commands written but not yet acknowledged.
+        # Marlin's default BUFSIZE is 4 and its RX buffer 128 bytes, so keep
+        # the window small unless the firmware was built with bigger queues.
+        self._window = max(1, min(int(window), _WINDOW_MAX))
+        self._inflight: collections.deque[str] = collections.deque()
+        self._rx = bytearray()          # received bytes not parsed yet
+        self._last_reply = b""
+
+        # reader thread: once connected it is the only one reading self.ser;
+        # it appends to self._rx and notifies _rx_cv
+        self._rx_cv = threading.Condition()
+        self._rx_thread: Optional[threading.Thread] = None
+        self._rx_error: Optional[Exception] = None
+        self._rx_wake: Optional[int] = None  # write end of the pipe that wakes the reader's poll()
+
+        # writer thread: the only one writing self.ser once connected, so lines
+        # sent from the UI thread (syringe) and the drawing worker never interleave
+        self._tx_q: "queue.SimpleQueue[Optional[bytes]]" = queue.SimpleQueue()
+        self._tx_thread: Optional[threading.Thread] = None
+        self._tx_error: Optional[Exception] = None
 
         # drawing infra
         self._drawing_thread: Optional[QThread] = None
         self._worker: Optional[DrawingWorker] = None
 
-        self._pause_event = threading.Event()
-        self._pause_event.set()  # not paused
+        # pause: flag guarded by a condition so resume/stop wake the worker at once
+        self._pause_cv = threading.Condition()
+        self._paused = False
         self._stop_event = threading.Event()
 
     def log(self, msg: str) -> None:
@@ -177,13 +409,22 @@ class MachineController(QObject):
 
     # ---------- Project I/O ----------
     def save_project(self, path: str) -> None:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.state.to_project_dict(), f, indent=2)
+        data = self.state.to_project_dict()
+        if orjson is not None:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
         self.log("Project saved")
 
     def load_project(self, path: str) -> None:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(path, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
         self.state.apply_project_dict(data)
         self.log("Loaded project")
 
@@ -217,28 +458,48 @@ class MachineController(QObject):
         c = canvas.Canvas(path)
         c.setFont("Helvetica-Bold", 24)
         c.drawString(40, 800, "Project Summary")
-        c.setFont("Helvetica", 14)
 
-        y = 760
-        for k, v in summary_dict.items():
-            c.drawString(40, y, f"{k}: {v}")
-            y -= 24
-            if y < 60:
-                c.showPage()
-                c.setFont("Helvetica", 14)
-                y = 800
+        # one text object per page; rows per page fixed by the 24 pt leading
+        # down to y=60: 30 below the title, 31 on the following pages
+        rows = [f"{k}: {v}" for k, v in summary_dict.items()]
+        y, n = 760, 30
+        while True:
+            t = c.beginText(40, y)
+            t.setFont("Helvetica", 14, leading=24)
+            t.textLines(rows[:n])
+            c.drawText(t)
+            rows = rows[n:]
+            if not rows:
+                break
+            c.showPage()
+            y, n = 800, 31
 
         c.save()
         self.log("PDF saved")
 
     # ---------- Serial ----------
     def _find_printer_port(self, baudrate: int = 115200) -> Optional[str]:
+        """
+        Pick the printer's serial device.
+        The last connected device and likely printers (known USB chip or USB
+        serial device name) are taken without opening them: an open can block
+        for seconds on Windows and on macOS Bluetooth ports. Other ports are
+        only probed with an open/close when there is no likely one.
+        """
         if list_ports is None:
             return None
-        for port in list(list_ports.comports()):
-            dev = getattr(port, "device", None)
-            if not dev:
-                continue
+
+        def likely(p: Any) -> bool:
+            return getattr(p, "vid", None) in _PRINTER_VIDS or any(
+                name in p.device for name in _PRINTER_PORT_NAMES
+            )
+
+        ports = [p for p in list_ports.comports() if getattr(p, "device", None)]
+        ports.sort(key=lambda p: (p.device != self._last_port, not likely(p)))
+        for port in ports:
+            dev = port.device
+            if dev == self._last_port or likely(port):
+                return dev
             try:
                 if serial is None:
                     return None
@@ -261,6 +522,9 @@ class MachineController(QObject):
 
         try:
             self.ser = serial.Serial(port, baudrate=baudrate, timeout=1)
+            self._inflight.clear()
+            self._rx.clear()
+            self._enable_low_latency()
 
             # many printers reboot on serial-open
             time.sleep(2.0)
@@ -269,8 +533,12 @@ class MachineController(QObject):
                 self.ser.reset_output_buffer()
             except Exception:
                 pass
+            self._start_reader()
+            self._start_writer()
 
             # mark connected first (so UI updates), then auto-home
+            self._last_port = port
+            self._settings.setValue("serial/last_port", port)
             self.connection_changed.emit(True)
             self.log(f"Connected to the printer on {port}")
             self.log("Homing printer...")
@@ -283,21 +551,221 @@ class MachineController(QObject):
 
         except Exception as e:
             self.log(f"Could not connect: {e}")
+            self._stop_writer()
             try:
                 if self.ser is not None:
                     self.ser.close()
             except Exception:
                 pass
             self.ser = None
+            self._stop_reader()
             self.connection_changed.emit(False)
             return False
 
+    def _enable_low_latency(self) -> bool:
+        """
+        Best effort: ask the USB-serial driver not to hold back received bytes.
+        FTDI-style adapters buffer replies for up to 16 ms by default, which
+        adds directly to every ok round-trip.
+        Linux: set ASYNC_LOW_LATENCY via TIOCGSERIAL/TIOCSSERIAL, and lower the
+        FTDI latency_timer in sysfs (needs write permission on that file).
+        macOS: set the receive data latency via IOSSDATALAT.
+        Windows: enlarge the driver RX buffer.
+        """
+        if self.ser is None:
+            return False
+        try:
+            if sys.platform.startswith("linux"):
+                timer = self._set_latency_timer(self.ser.port)
+                if timer is not None:
+                    self.log(f"USB latency timer: {timer} ms")
+                if fcntl is None:
+                    return timer is not None
+                fd = self.ser.fileno()
+                buf = bytearray(fcntl.ioctl(fd, _TIOCGSERIAL, bytes(_SERIAL_STRUCT_SIZE)))
+                flags = struct.unpack_from("i", buf, _SERIAL_FLAGS_OFFSET)[0]
+                if not flags & _ASYNC_LOW_LATENCY:
+                    struct.pack_into("i", buf, _SERIAL_FLAGS_OFFSET, flags | _ASYNC_LOW_LATENCY)
+                    fcntl.ioctl(fd, _TIOCSSERIAL, bytes(buf))
+                return True
+            if sys.platform == "darwin" and fcntl is not None:
+                fcntl.ioctl(self.ser.fileno(), _IOSSDATALAT, struct.pack("L", _DATA_LATENCY_US))
+                self.log(f"Serial data latency: {_DATA_LATENCY_US} us")
+                return True
+            if hasattr(self.ser, "set_buffer_size"):
+                self.ser.set_buffer_size(rx_size=4096)
+                return True
+        except Exception:
+            # pty, CDC-ACM without serial_struct support, missing permission...
+            pass
+        return False
+
+    @staticmethod
+    def _set_latency_timer(dev: str) -> Optional[int]:
+        """
+        FTDI (ftdi_sio) only: lower /sys/class/tty/<tty>/device/latency_timer to 1 ms.
+        Returns the effective value in ms, or None when the device has no such knob.
+        """
+        path = f"/sys/class/tty/{os.path.basename(os.path.realpath(dev))}/device/latency_timer"
+        try:
+            with open(path) as f:
+                timer = int(f.read().strip())
+        except (OSError, ValueError):
+            return None
+        if timer > 1:
+            try:
+                with open(path, "w") as f:
+                    f.write("1")
+                timer = 1
+            except OSError:
+                pass  # usually root-only; keep reporting the current value
+        return timer
+
+    # ---------- Reader thread ----------
+    def _start_reader(self) -> None:
+        """Start the thread that moves received bytes from self.ser into self._rx."""
+        with self._rx_cv:
+            self._rx.clear()
+            self._rx_error = None
+        # the wake pipe exists before the thread runs, so a _stop_reader()
+        # right after this can always reach it
+        wake_r = -1
+        if hasattr(select, "poll"):
+            wake_r, self._rx_wake = os.pipe()
+        self._rx_thread = threading.Thread(
+            target=self._rx_loop, args=(self.ser, wake_r), name="serial-rx", daemon=True
+        )
+        self._rx_thread.start()
+
+    def _stop_reader(self) -> None:
+        """Wait for the reader to notice the port was closed (call after ser.close())."""
+        t, self._rx_thread = self._rx_thread, None
+        wake, self._rx_wake = self._rx_wake, None
+        if wake is not None:
+            try:
+                os.write(wake, b"x")
+            except OSError:
+                pass
+        if t is not None and t is not threading.current_thread():
+            t.join(timeout=2.0)
+        if wake is not None:
+            os.close(wake)
+
+    def _rx_loop(self, ser: "serial.Serial", wake_r: int) -> None:  # type: ignore[name-defined]
+        # one read per burst of replies instead of one per byte (readline).
+        # POSIX: sleep in poll() on the fd and os.read() it directly;
+        # otherwise ser.read(1) blocks up to ser.timeout when nothing is waiting
+        poller = None
+        if wake_r >= 0:
+            try:
+                fd = ser.fileno()
+                poller = select.poll()
+                poller.register(fd, select.POLLIN)
+                poller.register(wake_r, select.POLLIN)
+            except Exception:
+                poller = None
+
+        while self.ser is ser:
+            try:
+                if poller is not None:
+                    # the timeout only matters if the wake pipe is never written
+                    events = dict(poller.poll(1000))
+                    if not events:
+                        continue
+                    if wake_r in events or events.get(fd, 0) & select.POLLNVAL:
+                        break  # _stop_reader() or port closed under us
+                    data = os.read(fd, 4096)
+                    if not data:
+                        raise OSError("device reports readiness to read but returned no data")
+                else:
+                    data = ser.read(max(1, min(ser.in_waiting, 4096)))
+            except Exception as e:
+                if self.ser is ser:
+                    self._rx_error = e
+                break
+            if data:
+                with self._rx_cv:
+                    self._rx += data
+                    self._rx_cv.notify_all()
+        if wake_r >= 0:
+            os.close(wake_r)
+        with self._rx_cv:
+            # no more replies will come: fail pending ack waits now rather than
+            # at their timeout (unless a new reader already owns the buffer)
+            if self._rx_error is None and self._rx_thread in (None, threading.current_thread()):
+                self._rx_error = ConnectionError("serial port closed")
+            self._rx_cv.notify_all()
+
+    # ---------- Writer thread ----------
+    def _start_writer(self) -> None:
+        """Start the thread that performs every self.ser.write, in queue order."""
+        self._tx_q = queue.SimpleQueue()
+        self._tx_error = None
+        self._tx_thread = threading.Thread(
+            target=self._tx_loop, args=(self.ser, self._tx_q), name="serial-tx", daemon=True
+        )
+        self._tx_thread.start()
+
+    def _stop_writer(self) -> None:
+        """Let the writer finish what is queued, then stop it (call before ser.close())."""
+        t, self._tx_thread = self._tx_thread, None
+        if t is not None:
+            self._tx_q.put(None)
+            if t is not threading.current_thread():
+                t.join(timeout=2.0)
+
+    def _tx_loop(
+        self,
+        ser: "serial.Serial",  # type: ignore[name-defined]
+        q: "queue.SimpleQueue[Optional[bytes]]",
+    ) -> None:
+        while True:
+            data = q.get()
+            if data is None:
+                return
+            try:
+                ser.write(data)
+            except Exception as e:
+                self._tx_error = e
+                with self._rx_cv:
+                    self._rx_cv.notify_all()  # fail the pending ack wait now
+                return
+
+    def _write(self, data: bytes) -> None:
+        """Queue bytes for the writer thread (direct write if it is not running)."""
+        if self._tx_error is not None:
+            raise RuntimeError(f"Serial write failed: {self._tx_error}")
+        if self._tx_thread is None:
+            ser = self.ser  # disconnect() may clear it from the GUI thread
+            if ser is None:
+                raise RuntimeError("No connection to the printer")
+            ser.write(data)
+        else:
+            self._tx_q.put(data)
+
+    def _read_line(self, timeout_s: float) -> Optional[bytes]:
+        """Pop one raw reply line (newline included) from self._rx; None on timeout."""
+        deadline = time.monotonic() + timeout_s
+        with self._rx_cv:
+            while True:
+                nl = self._rx.find(b"\n")
+                if nl >= 0:
+                    line = bytes(self._rx[:nl + 1])
+                    del self._rx[:nl + 1]
+                    return line
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._rx_error is not None:
+                    return None
+                self._rx_cv.wait(remaining)
+
     def disconnect(self) -> bool:
         try:
             self.stop_drawing()
+            self._stop_writer()
             if self.ser is not None:
                 self.ser.close()
                 self.ser = None
+            self._stop_reader()
             self.connection_changed.emit(False)
             self.log("Disconnected from the printer")
             return True
@@ -305,6 +773,23 @@ class MachineController(QObject):
             self.log(f"Could not disconnect: {e}")
             return False
 
+    @staticmethod
+    def _is_ok(line: bytes, command: str) -> bool:
+        """
+        Classify one firmware reply line (raw bytes, already stripped).
+        True on 'ok' / 'ok ...', False on busy/echo chatter, raises on errors.
+        """
+        low = line.lower()
+        if low.startswith(b"ok"):
+            return True
+        if b"busy" in low:
+            return False
+        if b"error" in low:
+            raise RuntimeError(
+                f"Firmware error after '{command}': {line.decode(errors='ignore')}"
+            )
+        return False
+
     def _send_and_wait_ok(self, command: str, timeout_s: float = 30.0) -> None:
         """
         Send one command and wait firmware OK.
@@ -313,34 +798,110 @@ class MachineController(QObject):
         if self.ser is None:
             raise RuntimeError("No connection to the printer")
 
-        self.ser.write((command + "\n").encode("utf-8"))
+        # pending streamed commands own the next oks
+        self._flush_window()
 
-        deadline = time.time() + timeout_s
-        last_nonempty = None
+        self._write(_cmd_bytes(command))
+        self._inflight.append(command)
+        self._wait_ack(timeout_s, check_stop=False)
 
-        while time.time() < deadline:
-            raw = self.ser.readline()
-            if not raw:
-                continue
+    def _send_and_wait_ok_multi(self, commands: Tuple[str, ...], timeout_s: float = 30.0) -> None:
+        """
+        Send a few one-off commands in one write and wait for one OK per command.
+        Keep the block well under the firmware RX buffer (128 bytes on stock Marlin).
+        """
+        if self.ser is None:
+            raise RuntimeError("No connection to the printer")
 
-            line = raw.decode(errors="ignore").strip()
-            if not line:
-                continue
+        self._flush_window(check_stop=False)
 
-            last_nonempty = line
-            low = line.lower()
+        self._write("".join(c + "\n" for c in commands).encode("utf-8"))
+        self._inflight.extend(commands)
+        while self._inflight:
+            self._wait_ack(timeout_s, check_stop=False)
 
-            if low == "ok" or low.startswith("ok"):
-                return
-            if "busy" in low:
-                continue
-            if "error" in low:
-                raise RuntimeError(f"Firmware error after '{command}': {line}")
+    # ---------- Windowed streaming ----------
+    def _send_window(self, cmd: str) -> None:
+        """
+        Stream one command without waiting for its OK.
+        Up to self._window commands stay unacknowledged, so the firmware
+        queue never runs dry while we format and send the next line.
+        Blocks only when the window is full.
+        """
+        if self.ser is None:
+            raise RuntimeError("No connection to the printer")
+        self._wait_pause_or_stop()
 
-        raise TimeoutError(
-            f"Timeout waiting for ok after: {command}"
-            + (f" (last: {last_nonempty})" if last_nonempty else "")
-        )
+        self._take_acks()
+        while len(self._inflight) >= self._window:
+            self._wait_ack()
+
+        self._write(_cmd_bytes(cmd))
+        self._inflight.append(cmd)
+
+    def _send_bulk(self, blob: bytes) -> None:
+        """
+        Write a block of static command lines with a single ser.write and
+        wait until every line is acknowledged.
+        Keep blocks well under the firmware RX buffer (128 bytes on stock Marlin).
+        """
+        if self.ser is None:
+            raise RuntimeError("No connection to the printer")
+        self._wait_pause_or_stop()
+
+        self._flush_window()
+        self._write(blob)
+        self._inflight.extend(blob.decode("utf-8").splitlines())
+        self._flush_window()
+
+    def _take_acks(self) -> None:
+        """Consume complete reply lines already in self._rx, popping acked commands (non-blocking)."""
+        with self._rx_cv:
+            rx = self._rx
+            while self._inflight:
+                nl = rx.find(b"\n")
+                if nl < 0:
+                    return
+                line = bytes(rx[:nl]).strip()
+                del rx[:nl + 1]
+                if not line:
+                    continue
+                self._last_reply = line
+                if self._is_ok(line, self._inflight[0]):
+                    self._inflight.popleft()
+
+    def _wait_ack(self, timeout_s: float = 30.0, check_stop: bool = True) -> None:
+        """Block until the oldest in-flight command is acknowledged."""
+        command = self._inflight[0]
+        pending = len(self._inflight)
+        deadline = time.monotonic() + timeout_s
+        self._last_reply = b""
+
+        with self._rx_cv:
+            self._take_acks()
+            while len(self._inflight) >= pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    last = self._last_reply.decode(errors="ignore")
+                    raise TimeoutError(
+                        f"Timeout waiting for ok after: {command}"
+                        + (f" (last: {last})" if last else "")
+                    )
+                if check_stop and self._stop_event.is_set():
+                    raise RuntimeError("Stopped")
+                if self._rx_error is not None:
+                    raise RuntimeError(f"Serial read failed: {self._rx_error}")
+                if self._tx_error is not None:
+                    raise RuntimeError(f"Serial write failed: {self._tx_error}")
+
+                # the reader thread notifies on new bytes; stop_drawing notifies too
+                self._rx_cv.wait(min(remaining, 1.0))
+                self._take_acks()
+
+    def _flush_window(self, check_stop: bool = True) -> None:
+        """Wait until every streamed command has been acknowledged."""
+        while self._inflight:
+            self._wait_ack(check_stop=check_stop)
 
     # ---------- Drawing controls ----------
     def start_drawing(self) -> None:
@@ -356,7 +917,8 @@ class MachineController(QObject):
             return
 
         self._stop_event.clear()
-        self._pause_event.set()
+        with self._pause_cv:
+            self._paused = False
 
         self._drawing_thread = QThread()
         self._worker = DrawingWorker(self)
@@ -377,6 +939,9 @@ class MachineController(QObject):
 
         self._drawing_thread.start()
 
+    def is_drawing(self) -> bool:
+        return self._drawing_thread is not None
+
     def _on_drawing_finished(self) -> None:
         self._drawing_thread = None
         self._worker = None
@@ -387,21 +952,24 @@ class MachineController(QObject):
     def pause_drawing(self) -> None:
         if self._drawing_thread is None:
             return
-        self._pause_event.clear()
+        with self._pause_cv:
+            self._paused = True
         self.drawing_paused_changed.emit(True)
         self.log("Paused")
 
     def resume_drawing(self) -> None:
         if self._drawing_thread is None:
             return
-        self._pause_event.set()
+        with self._pause_cv:
+            self._paused = False
+            self._pause_cv.notify_all()
         self.drawing_paused_changed.emit(False)
         self.log("Resumed")
 
     def toggle_pause(self) -> None:
         if self._drawing_thread is None:
             return
-        if self._pause_event.is_set():
+        if not self._paused:
             self.pause_drawing()
         else:
             self.resume_drawing()
@@ -410,7 +978,11 @@ class MachineController(QObject):
         if self._drawing_thread is None:
             return
         self._stop_event.set()
-        self._pause_event.set()
+        with self._pause_cv:
+            self._paused = False
+            self._pause_cv.notify_all()
+        with self._rx_cv:
+            self._rx_cv.notify_all()
 
     # ---------- Safe area helpers ----------
     def _safe_center(self) -> tuple[float, float, float, float, float, float]:
@@ -428,23 +1000,23 @@ class MachineController(QObject):
         orient: str,
         start_x: float,
         start_y: float,
+        bounds: Optional[tuple[float, float, float, float]] = None,
     ) -> tuple[float, float, float, float]:
         """
         Returns (x0, x1, y0, y1) of the work rectangle anchored at bottom-left (start_x, start_y),
         validated to be fully inside safe bounds (SAFE HARD).
         For Horizontal fibers: length along X, width along Y.
         For Vertical fibers: length along Y, width along X.
+        bounds: (x_min, x_max, y_min, y_max) already read by the caller; defaults to the params.
         """
-        x_min, x_max, y_min, y_max, _, _ = self._safe_center()
-        start_y += 20
-        if orient == "Horizontal":
-            x0, x1 = start_x, start_x + length
-            y0, y1 = start_y, start_y + width
-        else:
-            x0, x1 = start_x, start_x + width
-            y0, y1 = start_y, start_y + length
-
-        if x0 < x_min or x1 > x_max or y0 < y_min or y1 > y_max:
+        if bounds is None:
+            bounds = self._safe_center()[:4]
+        x_min, x_max, y_min, y_max = bounds
+        x0, x1, y0, y1, inside = _anchored_rect_core(
+            length, width, orient == "Horizontal", start_x, start_y,
+            x_min, x_max, y_min, y_max,
+        )
+        if not inside:
             raise RuntimeError(
                 f"Rectangle outside safe bounds. "
                 f"Rect: X[{x0:.2f},{x1:.2f}] Y[{y0:.2f},{y1:.2f}] | "
@@ -464,11 +1036,19 @@ class MachineController(QObject):
         )
 
     def draw_rectangle_is_valid(self) -> bool:
+        p = self.state.params
         try:
-            _ = self.get_draw_rectangle()
-            return True
-        except Exception:
+            *_, inside = _anchored_rect_core(
+                float(p.fiber_length),
+                float(p.fiber_width),
+                str(p.fiber_orientation) == "Horizontal",
+                float(p.start_x),
+                float(p.start_y),
+                *self._safe_center()[:4],
+            )
+        except (TypeError, ValueError):
             return False
+        return inside
 
     @staticmethod
     def _clamp(v: float, lo: float, hi: float) -> float:
@@ -478,14 +1058,23 @@ class MachineController(QObject):
     def _run_drawing_loop(self, status_signal: Signal) -> None:
         if self.ser is None:
             raise RuntimeError("No connection to the printer")
-        self._run_custom_centered(status_signal)
+        try:
+            self._run_custom_centered(status_signal)
+        finally:
+            # collect the oks of whatever is still queued (e.g. after Stop),
+            # so the next command is paired with its own reply
+            try:
+                self._flush_window(check_stop=False)
+            except Exception:
+                self._inflight.clear()
+                with self._rx_cv:
+                    self._rx.clear()
 
     def _wait_pause_or_stop(self) -> None:
-        # allows responsive stop while paused
-        while not self._pause_event.is_set():
-            if self._stop_event.is_set():
-                raise RuntimeError("Stopped")
-            time.sleep(0.05)
+        # sleeps without polling; resume_drawing/stop_drawing notify the condition
+        with self._pause_cv:
+            while self._paused and not self._stop_event.is_set():
+                self._pause_cv.wait()
         if self._stop_event.is_set():
             raise RuntimeError("Stopped")
 
@@ -501,39 +1090,40 @@ class MachineController(QObject):
         - user sets fiber_length (L), fiber_width (W), fiber_spacing (S)
         - rectangle is centered inside safe bounds
         - parameters are read live per-fiber
+        - commands are streamed through the send window (see _send_window)
         """
-        send = self._send_checked
+        send = self._send_window
 
         # header
-        send("M220 S100")
-        send("M302 S0")
-        send("M221 S100")
-        send("G90")
-        send("M82")
-        send("G1 Z2 F1500")
-        send("G92 E0")
-
-        def extrusion() -> None:
-            pp = self.state.params
+        self._send_bulk(_CUSTOM_HEADER)
+
+        # the dwell after each drop lets the droplet adhere before the nozzle
+        # moves; it cannot overlap the following moves (G4 blocks the planner),
+        # so it is only skipped when there is no droplet to wait for.
+        # Both take the fiber's snapshot values, so the amount subtracted from
+        # the syringe is the one actually sent even if the param changes meanwhile.
+        def extrusion(da: float) -> None:
+            if da <= 0:
+                return
             send("G91")
-            send(f"G1 E-{float(pp.droplet_amount)} F200")
+            send(f"G1 E-{da} F200")
             send("G4 P1000")
             send("G90")
             self.state.set_param(
-                "syringe_current_amount",
-                self.state.params.syringe_current_amount - float(pp.droplet_amount),
+                "syringe_current_amount", self.state.params.syringe_current_amount - da
             )
 
-        def afterdrop() -> None:
-            pp = self.state.params
+        def afterdrop(da: float, speed: int) -> None:
+            if da <= 0:
+                send(f"G1 F{speed}")
+                return
             send("G91")
-            send(f"G1 E-{float(pp.droplet_amount)} F200")
+            send(f"G1 E-{da} F200")
             send("G4 P500")
             send("G90")
-            send(f"G1 F{int(pp.speed)}")
+            send(f"G1 F{speed}")
             self.state.set_param(
-                "syringe_current_amount",
-                self.state.params.syringe_current_amount - float(pp.droplet_amount),
+                "syringe_current_amount", self.state.params.syringe_current_amount - da
             )
 
 
@@ -543,114 +1133,95 @@ class MachineController(QObject):
         send("G90")
         send(f"G1 Z7 F{int(self.state.params.speed)}")
 
+        # the safe bounds are read every fiber, but the clean moves derived
+        # from them are only rebuilt when the four values actually change
+        bounds = None
+
+        layer_key = None
+        layer: list[tuple[str, str, float]] = []
+        z_key = None
+        z_down = z_up = dwell = ""
+        # clean moves per (fiber end, speed); a layer only has two fiber ends
+        clean_moves: Dict[tuple[float, int], tuple[str, str, str]] = {}
+
         i = 0
         while True:
-            # allow live updates to apply to the NEXT fiber safely
-            pp = self.state.params
-
-            orient = str(pp.fiber_orientation)
-            L = float(pp.fiber_length)
-            W = float(pp.fiber_width)
-            S = float(pp.fiber_spacing)
+            # allow live updates to apply to the NEXT fiber safely: one snapshot
+            # per fiber, shared with extrusion()/afterdrop()
+            (orient, L, W, S, sx, sy, speed, zoff, zhop, pause_ms,
+             droplet, after, clean) = _snap(self.state.params)
 
             if L <= 0 or W < 0:
                 raise RuntimeError("Fiber length must be > 0 and width must be >= 0")
             if S <= 0:
                 raise RuntimeError("Fiber spacing must be > 0")
 
-            # SAFE HARD rectangle (raises if out of bounds)
-            x0, x1, y0, y1 = self._compute_anchored_rect(
-                L, W, orient, float(pp.start_x), float(pp.start_y)
-            )
-
-            speed = int(pp.speed)
-            zoff = float(pp.z_offset)
-            zhop = float(pp.z_hop)
-            pause_ms = int(pp.pause_ms)
-            after = bool(pp.afterdrop)
-            clean = bool(pp.clean)
-
-            if orient == "Horizontal":
-                y = y0 + i * S
-                if y > y1 + 1e-6:
-                    break
-
-                # alternate direction
-                if (i % 2) == 0:
-                    xs, xe = x0, x1
-                else:
-                    xs, xe = x1, x0
-
-                send(f"G1 X{xs:.3f} Y{y:.3f} F{speed}")
-                send(f"G1 Z{zoff:.3f} F{speed}")
-                extrusion()
-                send(f"G1 Z{zhop:.3f} F{speed}")
-                if pause_ms:
-                    send(f"G4 P{pause_ms}")
+            p = self.state.params
+            cur = (p.safe_x_min, p.safe_x_max, p.safe_y_min, p.safe_y_max)
+            if cur != bounds:
+                bounds = cur
+                x_min, x_max, y_min, y_max = bounds
+                clean_moves.clear()
 
-                send(f"G1 X{xe:.3f} Y{y:.3f} F{speed}")
-                send(f"G1 Z{zoff:.3f} F{speed}")
-
-                if after:
-                    afterdrop()
-
-                if clean:
-                    x_min, x_max, y_min, y_max, _, _ = self._safe_center()
+            # SAFE HARD rectangle (raises if out of bounds)
+            x0, x1, y0, y1 = self._compute_anchored_rect(L, W, orient, sx, sy, bounds=bounds)
+
+            # the layer's coordinates only change when the geometry does
+            key = (orient, x0, x1, y0, y1, S)
+            if key != layer_key:
+                layer_key, layer = key, _fiber_path(*key)
+                clean_moves.clear()
+            if i >= len(layer):
+                break
+            start_xy, end_xy, end = layer[i]
+
+            # Z moves and the dwell are formatted again only when their params change
+            if (zoff, zhop, speed, pause_ms) != z_key:
+                z_key = (zoff, zhop, speed, pause_ms)
+                z_down = f"G1 Z{_mm(_um(zoff))} F{speed}"
+                z_up = f"G1 Z{_mm(_um(zhop))} F{speed}"
+                dwell = f"G4 P{pause_ms}" if pause_ms else ""
+
+            send(f"G1 {start_xy} F{speed}")
+            send(z_down)
+            extrusion(droplet)
+            send(z_up)
+            if dwell:
+                send(dwell)
+
+            send(f"G1 {end_xy} F{speed}")
+            send(z_down)
+
+            if after:
+                afterdrop(droplet, speed)
+
+            if clean:
+                moves = clean_moves.get((end, speed))
+                if moves is None:
                     # move a bit further outside the end side (clamped to safe)
-                    if xe >= (x0 + x1) / 2.0:
-                        x_a = self._clamp(xe + 5.0, x_min, x_max)
-                        x_b = self._clamp(xe + 10.0, x_min, x_max)
-                    else:
-                        x_a = self._clamp(xe - 5.0, x_min, x_max)
-                        x_b = self._clamp(xe - 10.0, x_min, x_max)
-                    send(f"G1 X{x_a:.3f} Z0 F{speed}")
-                    send(f"G1 X{x_b:.3f} F{speed}")
-                    send(f"G1 Z3 F{speed}")
-
-                send("M400")
-
-            else:
-                x = x0 + i * S
-                if x > x1 + 1e-6:
-                    break
-
-                if (i % 2) == 0:
-                    ys, ye = y0, y1
-                else:
-                    ys, ye = y1, y0
-
-                send(f"G1 X{x:.3f} Y{ys:.3f} F{speed}")
-                send(f"G1 Z{zoff:.3f} F{speed}")
-                extrusion()
-                send(f"G1 Z{zhop:.3f} F{speed}")
-                if pause_ms:
-                    send(f"G4 P{pause_ms}")
-
-                send(f"G1 X{x:.3f} Y{ye:.3f} F{speed}")
-                send(f"G1 Z{zoff:.3f} F{speed}")
-
-                if after:
-                    afterdrop()
-
-                if clean:
-                    x_min, x_max, y_min, y_max, _, _ = self._safe_center()
-                    if ye >= (y0 + y1) / 2.0:
-                        y_a = self._clamp(ye + 5.0, y_min, y_max)
-                        y_b = self._clamp(ye + 10.0, y_min, y_max)
+                    if orient == "Horizontal":
+                        axis, lo, hi, mid = "X", x_min, x_max, (x0 + x1) / 2.0
                     else:
-                        y_a = self._clamp(ye - 5.0, y_min, y_max)
-                        y_b = self._clamp(ye - 10.0, y_min, y_max)
-                    send(f"G1 Y{y_a:.3f} Z0 F{speed}")
-                    send(f"G1 Y{y_b:.3f} F{speed}")
-                    send(f"G1 Z3 F{speed}")
-
-                send("M400")
+                        axis, lo, hi, mid = "Y", y_min, y_max, (y0 + y1) / 2.0
+                    step = 5.0 if end >= mid else -5.0
+                    c_a = self._clamp(end + step, lo, hi)
+                    c_b = self._clamp(end + 2 * step, lo, hi)
+                    moves = clean_moves[(end, speed)] = (
+                        f"G1 {axis}{_mm(_um(c_a))} Z0 F{speed}",
+                        f"G1 {axis}{_mm(_um(c_b))} F{speed}",
+                        f"G1 Z3 F{speed}",
+                    )
+                for line in moves:
+                    send(line)
+
+            send("M400")
 
             i += 1
 
             # footer
-            send("M300 S440 P200")
-            send("G0 X10 Y190 Z30 F3000")
+            self._send_bulk(_CUSTOM_FOOTER)
+
+        self._flush_window()
 
     # ---------- Legacy (ported from GUI.py logic, with live params) ----------
     
@@ -661,12 +1232,18 @@ class MachineController(QObject):
         if self.ser is None:
             self.log("Error: No connection to the printer")
             return
-        if ml_mark not in self._ML_TO_EPOS:
+        epos = self._ML_TO_EPOS.get(ml_mark)
+        if epos is None:
             self.log(f"Syringe: invalid mark {ml_mark}")
             return
-        epos = float(self._ML_TO_EPOS[ml_mark])
-        self.ser.write((f"M302 S0\nG1 E{int(epos)} F200\n").encode("utf-8"))
-        self.state.set_param("syringe_current_amount", epos)
+        # acked like every other command, so its oks are not left over for the
+        # send window or check_syringe to misattribute
+        try:
+            self._send_and_wait_ok_multi(("M302 S0", f"G1 E{epos} F200"))
+        except Exception as e:
+            self.log(f"Syringe move error: {e}")
+            return
+        self.state.set_param("syringe_current_amount", epos)  # coerced to float
         self.log(f"Go to {ml_mark} ml")
 
     def syringe_intake_amount(self) -> None:
@@ -675,9 +1252,14 @@ class MachineController(QObject):
             return
         p = self.state.params
         units = int(p.syringe_droplet_units)
-        self.ser.write(("G91\n").encode("utf-8"))
-        self.ser.write((f"M302 S0\nG1 E{units} F200 ;intake {units} units\n").encode("utf-8"))
-        self.ser.write(("G90\n").encode("utf-8"))
+        # one write (one USB frame) for the whole relative move, one ok per line
+        try:
+            self._send_and_wait_ok_multi(
+                ("G91", "M302 S0", f"G1 E{units} F200 ;intake {units} units", "G90")
+            )
+        except Exception as e:
+            self.log(f"Syringe intake error: {e}")
+            return
         self.state.set_param("syringe_current_amount", float(p.syringe_current_amount + units))
         self.log(f"Intake {units} units")
 
@@ -687,19 +1269,27 @@ class MachineController(QObject):
             return
 
         def check_syringe() -> Optional[str]:
-            self.ser.write(("M119\r\n").encode("utf-8"))
-            t0 = time.time()
-            while time.time() - t0 < 2.0:
-                line = self.ser.readline()
-                if line == b"filament: open\n":
-                    return "empty"
-                if line == b"filament: TRIGGERED\n":
-                    return "full"
-            return None
+            # M119 bypasses the send window, so its report *and* its ok are
+            # read here; a leftover ok would be taken as the next command's ack.
+            # Only an ok after the filament line is M119's own: one seen before
+            # it belongs to an earlier command and is skipped.
+            # Substring match: the firmware may end lines with \r\n.
+            self._write(b"M119\r\n")
+            end = time.monotonic() + 2.0
+            status = None
+            while True:
+                line = self._read_line(max(0.0, end - time.monotonic()))
+                if line is None:
+                    return status
+                if b"filament: open" in line:
+                    status = "empty"
+                elif b"filament: TRIGGERED" in line:
+                    status = "full"
+                elif status is not None and line.lower().startswith(b"ok"):
+                    return status
 
         try:
-            self._send_and_wait_ok("M302 P1")
-            self._send_and_wait_ok("M302")
+            self._send_and_wait_ok_multi(("M302 P1", "M302"))
 
             status = check_syringe()
             self._send_and_wait_ok("G91 E0")
@@ -713,8 +1303,7 @@ class MachineController(QObject):
                     self.state.set_param("syringe_current_amount", 0.0)
                 loops += 1
 
-            self._send_and_wait_ok("G92 E0")
-            self._send_and_wait_ok("G90")
+            self._send_and_wait_ok_multi(("G92 E0", "G90"))
             self.log("Syringe homed")
         except Exception as e:
             self.log(f"Syringe home error: {e}")
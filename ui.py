@@ -1,61 +1,95 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, QSize, Slot
-from PySide6.QtGui import QFont
+import os
+from functools import lru_cache, partial
+
+from PySide6.QtCore import Qt, QRect, QSignalBlocker, QSize, QThreadPool, QTimer, Slot
+from PySide6.QtGui import QBrush, QColor, QFont, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton,
     QListWidget, QListWidgetItem, QStackedWidget, QMessageBox, QFileDialog,
-    QComboBox, QSlider, QDoubleSpinBox, QGroupBox, QGridLayout,
-    QRadioButton, QButtonGroup, QTextEdit, QFrame, QSpinBox, QCheckBox
+    QComboBox, QSlider, QDoubleSpinBox, QGroupBox, QGridLayout, QFormLayout,
+    QPlainTextEdit, QFrame, QSpinBox, QCheckBox
 )
 
 from backend import AppState, MachineController
 
 
+# Qt.ConnectionType is a plain Enum in PySide6, so the flags are combined by value.
+_QUEUED_UNIQUE = Qt.ConnectionType(Qt.QueuedConnection.value | Qt.UniqueConnection.value)
+
+
+_STATE_STYLE = (
+    'QLabel[state="connected"] { color: #1b7f3a; }'
+    'QLabel[state="disconnected"] { color: #b00020; }'
+)
+
+
 INFO_TEXT = (
    ""
 )
 
 
+@lru_cache(maxsize=None)
+def _font(point_size: int, bold: bool = False) -> QFont:
+    # built on first use: a QFont needs the QApplication to exist
+    f = QFont()
+    f.setPointSize(point_size)
+    f.setBold(bold)
+    return f
+
+
 def _title_label(text: str) -> QLabel:
     lbl = QLabel(text)
-    f = QFont()
-    f.setPointSize(20)
-    f.setBold(True)
-    lbl.setFont(f)
+    lbl.setFont(_font(20, True))
     return lbl
 
 
 def _subtle_label(text: str) -> QLabel:
     lbl = QLabel(text)
-    f = QFont()
-    f.setPointSize(10)
-    f.setBold(False)
-    lbl.setFont(f)
+    lbl.setFont(_font(10))
     lbl.setStyleSheet("color: #666;")
     return lbl
 
 
+def _set_quietly(w: QWidget, current, setter, value) -> None:
+    """Push a state value into a widget without echoing it back; skipped when unchanged."""
+    if current == value:
+        return
+    with QSignalBlocker(w):
+        setter(value)
+
+
 class RectanglePreview(QWidget):
     """Live preview of safe area and current rectangle (green=valid, red=invalid)."""
 
+    BED_W = 170.0
+    BED_H = 230.0
+
     def __init__(self, controller: "MachineController", state: "AppState") -> None:
         super().__init__()
         self.controller = controller
         self.state = state
         self.setMinimumHeight(240)
-        self.state.changed.connect(self.update)
-
-    def paintEvent(self, event) -> None:
-        from PySide6.QtGui import QPainter, QPen, QColor, QBrush
-
-        BED_W = 170.0
-        BED_H = 230.0
+        # static layer (usable area outline), rebuilt on resize or safe-area change
+        self._bg = None
+        self._bg_key = None
+        self._pen_safe = QPen(QColor(120, 180, 255), 2)
+        self._no_brush = QBrush(Qt.NoBrush)
+        self._pen_rect = QPen(QColor(30, 30, 30), 2)
+        self._brush_valid = QBrush(QColor(0, 180, 0, 110))
+        self._brush_invalid = QBrush(QColor(200, 0, 0, 110))
+        # validity only changes with the params, so it is not re-checked per paint
+        self._valid = self.controller.draw_rectangle_is_valid()
+        self.state.changed.connect(self._on_state_changed)
 
-        p = self.state.params
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, True)
+    @Slot()
+    def _on_state_changed(self) -> None:
+        self._valid = self.controller.draw_rectangle_is_valid()
+        self.update()
 
+    def _frame(self) -> tuple[float, float, float, float]:
+        """bed mm -> widget px: (x origin, y origin at the bed's bottom edge, px per mm in x, in y)."""
         margin = 16.0
         avail_w = max(10.0, float(self.width()) - 2 * margin)
         avail_h = max(10.0, float(self.height()) - 2 * margin)
@@ -63,17 +97,30 @@ class RectanglePreview(QWidget):
 
         ox = (float(self.width()) - side) / 2.0
         oy = (float(self.height()) - side) / 2.0
-
-        def mx(x_mm: float) -> float:
-            return ox + (x_mm / BED_W) * side
-
-        def my(y_mm: float) -> float:
-            return oy + side - (y_mm / BED_H) * side
+        return ox, oy + side, side / self.BED_W, side / self.BED_H
+
+    def _rect(self, x0: float, x1: float, y0: float, y1: float, dy: float = 0.0) -> QRect:
+        """
+        Bed-mm rectangle [x0, x1] x [y0, y1] -> widget rect (y axis flipped),
+        moved dy px down. Truncated to whole pixels so the 2 px outlines stay crisp.
+        """
+        ox, oy_bottom, kx, ky = self._frame()
+        return QRect(int(ox + x0 * kx), int(oy_bottom - y1 * ky + dy), int((x1 - x0) * kx), int((y1 - y0) * ky))
+
+    def _background(self, p) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr, p.safe_x_min, p.safe_x_max, p.safe_y_min, p.safe_y_max)
+        if key == self._bg_key:
+            return self._bg
+
+        bg = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+        bg.setDevicePixelRatio(dpr)
+        bg.fill(Qt.transparent)
+        painter = QPainter(bg)
 
         # Bed outline
-        painter.setPen(QPen(QColor(200, 200, 200), 2))
-        painter.setBrush(QBrush(Qt.NoBrush))
-        #painter.drawRect(ox, oy, side, side)
+        #painter.setPen(QPen(QColor(200, 200, 200), 2))
+        #painter.drawRect(self._rect(0.0, self.BED_W, 0.0, self.BED_H))
 
         # Usable area outline
         sx0 = float(p.safe_x_min)
@@ -81,14 +128,20 @@ class RectanglePreview(QWidget):
         sy0 = float(p.safe_y_min)
         sy1 = float(p.safe_y_max)
 
-        painter.setPen(QPen(QColor(120, 180, 255), 2))
-        painter.setBrush(QBrush(Qt.NoBrush))
-        rx = mx(sx0)
-        ry = my(sy1) + 20
-        rw = mx(sx1) - mx(sx0)
-        rh = my(sy0) - my(sy1)
-        painter.drawRect(rx, ry, rw, rh)
-        painter.drawRect(rx + 65, ry + 65, 80 , 80)  
+        painter.setPen(self._pen_safe)
+        painter.setBrush(self._no_brush)
+        safe = self._rect(sx0, sx1, sy0, sy1, dy=20)
+        painter.drawRect(safe)
+        painter.drawRect(safe.x() + 65, safe.y() + 65, 80, 80)
+        painter.end()
+
+        self._bg, self._bg_key = bg, key
+        return bg
+
+    def paintEvent(self, event) -> None:
+        p = self.state.params
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background(p))
 
         # Requested rectangle
         orient = str(p.fiber_orientation)
@@ -104,20 +157,10 @@ class RectanglePreview(QWidget):
             x0, x1 = sx, sx + Wd
             y0, y1 = sy, sy + L
 
-        try:
-            _ = self.controller.get_draw_rectangle()
-            valid = True
-        except Exception:
-            valid = False
+        painter.setPen(self._pen_rect)
+        painter.setBrush(self._brush_valid if self._valid else self._brush_invalid)
 
-        painter.setPen(QPen(QColor(30, 30, 30), 2))
-        painter.setBrush(QBrush(QColor(0, 180, 0, 110) if valid else QColor(200, 0, 0, 110)))
-
-        rrx = mx(x0)
-        rry = my(y1)
-        rrw = mx(x1) - mx(x0)
-        rrh = my(y0) - my(y1)
-        painter.drawRect(rrx, rry, rrw, rrh)
+        painter.drawRect(self._rect(x0, x1, y0, y1))
 
 
 
@@ -143,6 +186,9 @@ class MainWindow(QMainWindow):
 
         self.stack = QStackedWidget()
 
+        self._machine_pool = QThreadPool(self)
+        self._machine_pool.setMaxThreadCount(1)
+
         root_layout.addWidget(self.sidebar)
         root_layout.addWidget(self.stack, 1)
 
@@ -153,6 +199,7 @@ class MainWindow(QMainWindow):
         self.page_connection = ConnectionPage(self)
         #self.page_log = LogPage(self)
 
+        self._page_index = {}
         self._add_page("Welcome", self.page_welcome)
         self._add_page("Draw", self.page_draw)
         self._add_page("Syringe", self.page_syringe)
@@ -166,10 +213,36 @@ class MainWindow(QMainWindow):
         self.sidebar.setCurrentRow(0)
 
         self.controller.connection_changed.connect(self.page_connection.on_connection_changed)
-        self.state.log.connect(self.page_connection.append_log)
+        self.state.log.connect(self.page_connection.append_log, Qt.QueuedConnection)
+
+    def invoke_async(self, fn, *args) -> None:
+        """
+        Run a blocking machine action (serial round-trips) off the GUI thread.
+        The pool has a single thread, so actions run one at a time in click order.
+        Actions are refused while a drawing runs: they would share the serial
+        ack accounting with the drawing worker and take each other's oks.
+        """
+        if self.controller.is_drawing():
+            self.controller.log("Busy: drawing is running")
+            return
+
+        def job() -> None:
+            # re-checked here for actions queued before the drawing started
+            if self.controller.is_drawing():
+                self.controller.log("Busy: drawing is running")
+                return
+            try:
+                fn(*args)
+            except Exception as e:
+                self.controller.log(f"Error: {e}")
+
+        self._machine_pool.start(job)
+
+    def machine_busy(self) -> bool:
+        return self._machine_pool.activeThreadCount() > 0
 
     def _add_page(self, title: str, widget: QWidget) -> None:
-        self.stack.addWidget(widget)
+        self._page_index[title] = self.stack.addWidget(widget)
         self.sidebar.addItem(QListWidgetItem(title))
 
     def _set_project_mode(self, enabled: bool) -> None:
@@ -178,8 +251,11 @@ class MainWindow(QMainWindow):
             item.setFlags(item.flags() | Qt.ItemIsEnabled if enabled else item.flags() & ~Qt.ItemIsEnabled)
 
     def go(self, name: str) -> None:
-        mapping = {"Welcome": 0, "Draw": 1, "Syringe": 2, "Summary": 3, "Connection": 4, "Log": 5}
-        self.sidebar.setCurrentRow(mapping[name])
+        i = self._page_index[name]
+        # switch the stack directly; the sidebar only needs its highlight moved
+        with QSignalBlocker(self.sidebar):
+            self.sidebar.setCurrentRow(i)
+        self.stack.setCurrentIndex(i)
 
     def start_new_project(self) -> None:
         self._set_project_mode(True)
@@ -187,20 +263,44 @@ class MainWindow(QMainWindow):
         self.go("Draw")
         self.controller.log("New project")
 
+    def _open_file_dialog(self, title: str, name_filter: str, save: bool, on_selected) -> None:
+        """
+        Qt's own (non-native) file dialog, opened window-modal with open():
+        returns at once and the event loop keeps running (log, connection
+        state) while the user picks a file; on_selected(path) runs on accept.
+        """
+        dlg = QFileDialog(self, title, "", name_filter)
+        dlg.setOption(QFileDialog.DontUseNativeDialog, True)
+        if save:
+            dlg.setAcceptMode(QFileDialog.AcceptSave)
+            dlg.setFileMode(QFileDialog.AnyFile)
+        else:
+            dlg.setAcceptMode(QFileDialog.AcceptOpen)
+            dlg.setFileMode(QFileDialog.ExistingFile)
+        dlg.setAttribute(Qt.WA_DeleteOnClose)
+        dlg.fileSelected.connect(on_selected)
+        dlg.open()
+
     def load_project_dialog(self) -> None:
-        path, _ = QFileDialog.getOpenFileName(self, "Load Project", "", "JSON files (*.json)")
+        self._open_file_dialog("Load Project", "JSON files (*.json)", False, self._load_project)
+
+    @Slot(str)
+    def _load_project(self, path: str) -> None:
         if not path:
             return
         try:
             self.controller.load_project(path)
             self._set_project_mode(True)
-            self.setWindowTitle(f"Nanofiber Machine - {path.split('/')[-1]}")
+            self.setWindowTitle(f"Nanofiber Machine - {os.path.basename(path)}")
             self.go("Draw")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not load project:\n{e}")
 
     def save_project_dialog(self) -> None:
-        path, _ = QFileDialog.getSaveFileName(self, "Save Project", "", "JSON files (*.json)")
+        self._open_file_dialog("Save Project", "JSON files (*.json)", True, self._save_project)
+
+    @Slot(str)
+    def _save_project(self, path: str) -> None:
         if not path:
             return
         if not path.lower().endswith(".json"):
@@ -211,7 +311,10 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", f"Could not save project:\n{e}")
 
     def save_pdf_dialog(self) -> None:
-        path, _ = QFileDialog.getSaveFileName(self, "Save PDF", "", "PDF files (*.pdf)")
+        self._open_file_dialog("Save PDF", "PDF files (*.pdf)", True, self._save_pdf)
+
+    @Slot(str)
+    def _save_pdf(self, path: str) -> None:
         if not path:
             return
         if not path.lower().endswith(".pdf"):
@@ -235,10 +338,7 @@ class WelcomePage(QWidget):
         layout.setSpacing(16)
 
         title = QLabel("MicroFiber Machine Interface")
-        f = QFont()
-        f.setPointSize(26)
-        f.setBold(True)
-        title.setFont(f)
+        title.setFont(_font(26, True))
         title.setAlignment(Qt.AlignCenter)
 
         btn_row = QHBoxLayout()
@@ -277,6 +377,16 @@ class DrawPage(QWidget):
 
         # Force rectangle mode (legacy UI removed)
 
+        def spin(decimals, lo, hi, step, slot):
+            # decimals=None -> integer QSpinBox
+            w = QSpinBox() if decimals is None else QDoubleSpinBox()
+            if decimals is not None:
+                w.setDecimals(decimals)
+            w.setRange(lo, hi)
+            w.setSingleStep(step)
+            w.valueChanged.connect(slot)
+            return w
+
         # ---------------- Rectangle parameters ----------------
         rect = QGroupBox("Layout parameters")
         rect_grid = QGridLayout(rect)
@@ -285,37 +395,13 @@ class DrawPage(QWidget):
 
         self.fiber_orientation = QComboBox()
         self.fiber_orientation.addItems(["Horizontal", "Vertical"])
-        self.fiber_orientation.currentTextChanged.connect(lambda t: self.state.set_param("fiber_orientation", t))
-
-        self.fiber_length = QDoubleSpinBox()
-        self.fiber_length.setDecimals(2)
-        self.fiber_length.setRange(0.0, 10000.0)
-        self.fiber_length.setSingleStep(1.0)
-        self.fiber_length.valueChanged.connect(lambda v: self.state.set_param("fiber_length", float(v)))
-
-        self.fiber_width = QDoubleSpinBox()
-        self.fiber_width.setDecimals(2)
-        self.fiber_width.setRange(0.0, 10000.0)
-        self.fiber_width.setSingleStep(1.0)
-        self.fiber_width.valueChanged.connect(lambda v: self.state.set_param("fiber_width", float(v)))
-
-        self.fiber_spacing = QDoubleSpinBox()
-        self.fiber_spacing.setDecimals(2)
-        self.fiber_spacing.setRange(0.01, 10000.0)
-        self.fiber_spacing.setSingleStep(0.1)
-        self.fiber_spacing.valueChanged.connect(lambda v: self.state.set_param("fiber_spacing", float(v)))
-
-        self.start_x = QDoubleSpinBox()
-        self.start_x.setDecimals(2)
-        self.start_x.setRange(-1000.0, 1000.0)
-        self.start_x.setSingleStep(1.0)
-        self.start_x.valueChanged.connect(lambda v: self.state.set_param("start_x", float(v)))
-
-        self.start_y = QDoubleSpinBox()
-        self.start_y.setDecimals(2)
-        self.start_y.setRange(-1000.0, 1000.0)
-        self.start_y.setSingleStep(1.0)
-        self.start_y.valueChanged.connect(lambda v: self.state.set_param("start_y", float(v)))
+        self.fiber_orientation.currentTextChanged.connect(self._on_fiber_orientation)
+
+        self.fiber_length = spin(2, 0.0, 10000.0, 1.0, self._on_fiber_length)
+        self.fiber_width = spin(2, 0.0, 10000.0, 1.0, self._on_fiber_width)
+        self.fiber_spacing = spin(2, 0.01, 10000.0, 0.1, self._on_fiber_spacing)
+        self.start_x = spin(2, -1000.0, 1000.0, 1.0, self._on_start_x)
+        self.start_y = spin(2, -1000.0, 1000.0, 1.0, self._on_start_y)
 
         rect_grid.addWidget(QLabel("Orientation"), 0, 0)
         rect_grid.addWidget(self.fiber_orientation, 0, 1)
@@ -345,43 +431,24 @@ class DrawPage(QWidget):
         # speed slider + label
         self.speed = QSlider(Qt.Horizontal)
         self.speed.setRange(100, 5000)
-        self.speed.valueChanged.connect(lambda v: self.state.set_param("speed", int(v)))
+        self.speed.valueChanged.connect(self._on_speed)
         self.speed_label = QLabel("")
 
-        # droplet amount
-        self.amount = QDoubleSpinBox()
-        self.amount.setDecimals(3)
-        self.amount.setRange(0.0, 1000.0)
-        self.amount.setSingleStep(0.1)
-        self.amount.valueChanged.connect(lambda v: self.state.set_param("droplet_amount", float(v)))
-
-        # z-hop
-        self.zhop = QDoubleSpinBox()
-        self.zhop.setDecimals(2)
-        self.zhop.setRange(0.0, 1000.0)
-        self.zhop.setSingleStep(0.5)
-        self.zhop.valueChanged.connect(lambda v: self.state.set_param("z_hop", float(v)))
-
-        # z-offset
-        self.zoffset = QDoubleSpinBox()
-        self.zoffset.setDecimals(3)
-        self.zoffset.setRange(-1000.0, 1000.0)
-        self.zoffset.setSingleStep(0.01)
-        self.zoffset.valueChanged.connect(lambda v: self.state.set_param("z_offset", float(v)))
-
-        # pause ms
-        self.pause_ms = QSpinBox()
-        self.pause_ms.setRange(0, 600000)
-        self.pause_ms.valueChanged.connect(lambda v: self.state.set_param("pause_ms", int(v)))
+        # droplet amount, z-hop, z-offset, pause (ms)
+        self.amount = spin(3, 0.0, 1000.0, 0.1, self._on_droplet_amount)
+        self.zhop = spin(2, 0.0, 1000.0, 0.5, self._on_z_hop)
+        self.zoffset = spin(3, -1000.0, 1000.0, 0.01, self._on_z_offset)
+        self.pause_ms = spin(None, 0, 600000, 1, self._on_pause_ms)
 
         self.chk_afterdrop = QCheckBox("Afterdrop")
-        self.chk_afterdrop.toggled.connect(lambda v: self.state.set_param("afterdrop", bool(v)))
+        self.chk_afterdrop.toggled.connect(self._on_afterdrop)
 
         self.chk_clean = QCheckBox("Clean")
-        self.chk_clean.toggled.connect(lambda v: self.state.set_param("clean", bool(v)))
+        self.chk_clean.toggled.connect(self._on_clean)
 
         self.btn_test_z = QPushButton("Test Z-Offset")
-        self.btn_test_z.clicked.connect(self.controller.test_zoffset)
+        self.btn_test_z.clicked.connect(partial(self.mw.invoke_async, self.controller.test_zoffset))
+        self.controller.drawing_running_changed.connect(self._on_drawing_running)
 
         common_grid.addWidget(QLabel("Speed"), 0, 0)
         common_grid.addWidget(self.speed, 0, 1, 1, 2)
@@ -404,50 +471,93 @@ class DrawPage(QWidget):
         nav = QHBoxLayout()
         nav.addStretch(1)
         self.btn_next = QPushButton("Next →")
-        self.btn_next.clicked.connect(lambda: self.mw.go("Syringe"))
+        self.btn_next.clicked.connect(partial(self.mw.go, "Syringe"))
         nav.addWidget(self.btn_next)
         outer.addLayout(nav)
 
-        self.state.changed.connect(self._sync_from_state)
+        self.state.changed.connect(self._sync_from_state, _QUEUED_UNIQUE)
         self._sync_from_state()
 
+    # widget -> state (set_param coerces to the field's type)
+    @Slot(str)
+    def _on_fiber_orientation(self, t: str) -> None:
+        self.state.set_param("fiber_orientation", t)
+
+    @Slot(float)
+    def _on_fiber_length(self, v: float) -> None:
+        self.state.set_param("fiber_length", v)
+
+    @Slot(float)
+    def _on_fiber_width(self, v: float) -> None:
+        self.state.set_param("fiber_width", v)
+
+    @Slot(float)
+    def _on_fiber_spacing(self, v: float) -> None:
+        self.state.set_param("fiber_spacing", v)
+
+    @Slot(float)
+    def _on_start_x(self, v: float) -> None:
+        self.state.set_param("start_x", v)
+
+    @Slot(float)
+    def _on_start_y(self, v: float) -> None:
+        self.state.set_param("start_y", v)
+
+    @Slot(int)
+    def _on_speed(self, v: int) -> None:
+        self.state.set_param("speed", v)
+
+    @Slot(float)
+    def _on_droplet_amount(self, v: float) -> None:
+        self.state.set_param("droplet_amount", v)
+
+    @Slot(float)
+    def _on_z_hop(self, v: float) -> None:
+        self.state.set_param("z_hop", v)
+
+    @Slot(float)
+    def _on_z_offset(self, v: float) -> None:
+        self.state.set_param("z_offset", v)
+
+    @Slot(int)
+    def _on_pause_ms(self, v: int) -> None:
+        self.state.set_param("pause_ms", v)
+
+    @Slot(bool)
+    def _on_afterdrop(self, v: bool) -> None:
+        self.state.set_param("afterdrop", v)
+
+    @Slot(bool)
+    def _on_clean(self, v: bool) -> None:
+        self.state.set_param("clean", v)
+
+    @Slot(bool)
+    def _on_drawing_running(self, running: bool) -> None:
+        self.btn_test_z.setEnabled(not running)
+
     @Slot()
     def _sync_from_state(self) -> None:
         p = self.state.params
 
         # rectangle
-        self.fiber_orientation.blockSignals(True)
-        self.fiber_orientation.setCurrentText(str(p.fiber_orientation))
-        self.fiber_orientation.blockSignals(False)
-
+        o = self.fiber_orientation
+        _set_quietly(o, o.currentText(), o.setCurrentText, str(p.fiber_orientation))
         for w, val in [(self.fiber_length, p.fiber_length), (self.fiber_width, p.fiber_width), (self.fiber_spacing, p.fiber_spacing),
                       (self.start_x, p.start_x), (self.start_y, p.start_y)]:
-            w.blockSignals(True)
-            w.setValue(float(val))
-            w.blockSignals(False)
+            _set_quietly(w, w.value(), w.setValue, val)
 
         # common
-        self.speed.blockSignals(True)
-        self.speed.setValue(int(p.speed))
-        self.speed.blockSignals(False)
-        self.speed_label.setText(f"{int(p.speed)} mm/min")
-
-        for w, val in [(self.amount, p.droplet_amount), (self.zhop, p.z_hop), (self.zoffset, p.z_offset)]:
-            w.blockSignals(True)
-            w.setValue(float(val))
-            w.blockSignals(False)
-
-        self.pause_ms.blockSignals(True)
-        self.pause_ms.setValue(int(p.pause_ms))
-        self.pause_ms.blockSignals(False)
+        _set_quietly(self.speed, self.speed.value(), self.speed.setValue, p.speed)
+        text = f"{p.speed} mm/min"
+        if self.speed_label.text() != text:
+            self.speed_label.setText(text)
 
-        self.chk_afterdrop.blockSignals(True)
-        self.chk_afterdrop.setChecked(bool(p.afterdrop))
-        self.chk_afterdrop.blockSignals(False)
+        for w, val in [(self.amount, p.droplet_amount), (self.zhop, p.z_hop), (self.zoffset, p.z_offset),
+                       (self.pause_ms, p.pause_ms)]:
+            _set_quietly(w, w.value(), w.setValue, val)
 
-        self.chk_clean.blockSignals(True)
-        self.chk_clean.setChecked(bool(p.clean))
-        self.chk_clean.blockSignals(False)
+        for w, val in [(self.chk_afterdrop, p.afterdrop), (self.chk_clean, p.clean)]:
+            _set_quietly(w, w.isChecked(), w.setChecked, val)
 
 
 class SyringePage(QWidget):
@@ -493,8 +603,7 @@ class SyringePage(QWidget):
         cur_row = QHBoxLayout()
         cur_row.addWidget(QLabel("Current amount:"), 0, Qt.AlignLeft)
         self.lbl_current = QLabel("0.00")
-        f = QFont(); f.setPointSize(14)
-        self.lbl_current.setFont(f)
+        self.lbl_current.setFont(_font(14))
         cur_row.addWidget(self.lbl_current, 0, Qt.AlignLeft)
         cur_row.addStretch(1)
         outer.addLayout(cur_row)
@@ -503,7 +612,7 @@ class SyringePage(QWidget):
         intake_row.addWidget(QLabel("Droplet size to intake"), 0, Qt.AlignLeft)
         self.spin_droplet = QSpinBox()
         self.spin_droplet.setRange(0, 10000)
-        self.spin_droplet.valueChanged.connect(lambda v: self.state.set_param("syringe_droplet_units", int(v)))
+        self.spin_droplet.valueChanged.connect(partial(self.state.set_param, "syringe_droplet_units"))
         intake_row.addWidget(self.spin_droplet, 0, Qt.AlignLeft)
         intake_row.addStretch(1)
 
@@ -518,33 +627,54 @@ class SyringePage(QWidget):
         nav.addStretch(1)
         self.btn_back = QPushButton("Back")
         self.btn_next = QPushButton("Next")
-        self.btn_back.clicked.connect(lambda: self.mw.go("Draw"))
-        self.btn_next.clicked.connect(lambda: self.mw.go("Summary"))
+        self.btn_back.clicked.connect(partial(self.mw.go, "Draw"))
+        self.btn_next.clicked.connect(partial(self.mw.go, "Summary"))
         nav.addWidget(self.btn_back)
         nav.addWidget(self.btn_next)
         outer.addLayout(nav)
 
-        self.btn_home.clicked.connect(self.controller.syringe_home)
-        self.btn_1.clicked.connect(lambda: self.controller.syringe_goto_ml(1))
-        self.btn_2.clicked.connect(lambda: self.controller.syringe_goto_ml(2))
-        self.btn_3.clicked.connect(lambda: self.controller.syringe_goto_ml(3))
-        self.btn_4.clicked.connect(lambda: self.controller.syringe_goto_ml(4))
-        self.btn_5.clicked.connect(lambda: self.controller.syringe_goto_ml(5))
-        self.btn_intake.clicked.connect(self.controller.syringe_intake_amount)
+        self.btn_home.clicked.connect(partial(self.mw.invoke_async, self.controller.syringe_home))
+        for ml, btn in enumerate((self.btn_1, self.btn_2, self.btn_3, self.btn_4, self.btn_5), start=1):
+            btn.clicked.connect(partial(self.mw.invoke_async, self.controller.syringe_goto_ml, ml))
+        self.btn_intake.clicked.connect(partial(self.mw.invoke_async, self.controller.syringe_intake_amount))
+        self.controller.drawing_running_changed.connect(self._on_drawing_running)
 
-        self.state.changed.connect(self._sync_from_state)
+        self.state.changed.connect(self._sync_from_state, _QUEUED_UNIQUE)
         self._sync_from_state()
 
     @Slot()
     def _sync_from_state(self) -> None:
         p = self.state.params
-        self.lbl_current.setText(f"{p.syringe_current_amount:.2f}")
-        self.spin_droplet.blockSignals(True)
-        self.spin_droplet.setValue(int(p.syringe_droplet_units))
-        self.spin_droplet.blockSignals(False)
+        text = f"{p.syringe_current_amount:.2f}"
+        if self.lbl_current.text() != text:
+            self.lbl_current.setText(text)
+        _set_quietly(self.spin_droplet, self.spin_droplet.value(), self.spin_droplet.setValue, p.syringe_droplet_units)
+
+    @Slot(bool)
+    def _on_drawing_running(self, running: bool) -> None:
+        # machine actions would interleave with the drawing's serial traffic
+        for btn in (self.btn_home, self.btn_1, self.btn_2, self.btn_3, self.btn_4, self.btn_5, self.btn_intake):
+            btn.setEnabled(not running)
 
 
 class SummaryPage(QWidget):
+    # (caption, Params -> displayed text), in display order
+    _ROWS = (
+        ("Orientation", lambda p: p.fiber_orientation),
+        ("Speed", lambda p: f"{p.speed} mm/min"),
+        ("Z-Offset", lambda p: f"{p.z_offset} mm"),
+        ("Z-Hop", lambda p: f"{p.z_hop} mm"),
+        ("Pause (ms)", lambda p: str(p.pause_ms)),
+        ("Droplet Amount", lambda p: str(p.droplet_amount)),
+        ("Afterdrop", lambda p: "on" if p.afterdrop else "off"),
+        ("Clean", lambda p: "on" if p.clean else "off"),
+        ("Fiber Length", lambda p: f"{p.fiber_length} mm"),
+        ("Fiber Width", lambda p: f"{p.fiber_width} mm"),
+        ("Fiber Spacing", lambda p: f"{p.fiber_spacing} mm"),
+        ("Syringe Current Amount", lambda p: f"{p.syringe_current_amount:.2f}"),
+        ("Syringe Droplet Units", lambda p: str(p.syringe_droplet_units)),
+    )
+
     def __init__(self, mw: MainWindow) -> None:
         super().__init__()
         self.mw = mw
@@ -562,32 +692,17 @@ class SummaryPage(QWidget):
         top.addWidget(self.btn_update)
         outer.addLayout(top)
 
-        self.labels = {}
-        info_grid = QGridLayout()
-
-        keys = [
-            "Orientation",
-            "Speed",
-            "Z-Offset",
-            "Z-Hop",
-            "Pause (ms)",
-            "Droplet Amount",
-            "Afterdrop",
-            "Clean",
-            "Fiber Length",
-            "Fiber Width",
-            "Fiber Spacing",
-            "Syringe Current Amount",
-            "Syringe Droplet Units",
-        ]
-        for r, k in enumerate(keys):
-            info_grid.addWidget(QLabel(f"{k}:"), r, 0, alignment=Qt.AlignLeft)
+        self._rows = []
+        info_form = QFormLayout()
+        info_form.setLabelAlignment(Qt.AlignLeft)
+        info_form.setFormAlignment(Qt.AlignLeft | Qt.AlignTop)
+        for k, fmt in self._ROWS:
             val = QLabel("-")
             val.setTextInteractionFlags(Qt.TextSelectableByMouse)
-            info_grid.addWidget(val, r, 1, alignment=Qt.AlignLeft)
-            self.labels[k] = val
+            info_form.addRow(f"{k}:", val)
+            self._rows.append((val, fmt))
 
-        outer.addLayout(info_grid)
+        outer.addLayout(info_form)
 
         btn_col = QVBoxLayout()
         self.btn_save_project = QPushButton("Save Project")
@@ -607,8 +722,8 @@ class SummaryPage(QWidget):
         nav.addStretch(1)
         self.btn_back = QPushButton("Back")
         self.btn_next = QPushButton("Next")
-        self.btn_back.clicked.connect(lambda: self.mw.go("Syringe"))
-        self.btn_next.clicked.connect(lambda: self.mw.go("Connection"))
+        self.btn_back.clicked.connect(partial(self.mw.go, "Syringe"))
+        self.btn_next.clicked.connect(partial(self.mw.go, "Connection"))
         nav.addWidget(self.btn_back)
         nav.addWidget(self.btn_next)
         outer.addLayout(nav)
@@ -617,34 +732,16 @@ class SummaryPage(QWidget):
         self.btn_save_pdf.clicked.connect(self.mw.save_pdf_dialog)
         self.btn_load.clicked.connect(self.mw.load_project_dialog)
 
-        self.state.changed.connect(self.update_labels)
+        self.state.changed.connect(self.update_labels, _QUEUED_UNIQUE)
         self.update_labels()
 
     @Slot()
     def update_labels(self) -> None:
         p = self.state.params
-        x_min, x_max, y_min, y_max = p.safe_x_min, p.safe_x_max, p.safe_y_min, p.safe_y_max
-        xc = (x_min + x_max) / 2.0
-        yc = (y_min + y_max) / 2.0
-
-
-        self.labels["Orientation"].setText(p.fiber_orientation)
-
-        self.labels["Speed"].setText(f"{p.speed} mm/min")
-        self.labels["Z-Offset"].setText(f"{p.z_offset} mm")
-        self.labels["Z-Hop"].setText(f"{p.z_hop} mm")
-        self.labels["Pause (ms)"].setText(str(p.pause_ms))
-        self.labels["Droplet Amount"].setText(str(p.droplet_amount))
-        self.labels["Afterdrop"].setText("on" if p.afterdrop else "off")
-        self.labels["Clean"].setText("on" if p.clean else "off")
-
-
-        self.labels["Fiber Length"].setText(f"{p.fiber_length} mm")
-        self.labels["Fiber Width"].setText(f"{p.fiber_width} mm")
-        self.labels["Fiber Spacing"].setText(f"{p.fiber_spacing} mm")
-
-        self.labels["Syringe Current Amount"].setText(f"{p.syringe_current_amount:.2f}")
-        self.labels["Syringe Droplet Units"].setText(str(p.syringe_droplet_units))
+        for lbl, fmt in self._rows:
+            txt = fmt(p)
+            if lbl.text() != txt:
+                lbl.setText(txt)
 
 
 class ConnectionPage(QWidget):
@@ -666,9 +763,10 @@ class ConnectionPage(QWidget):
         outer.addLayout(top)
 
         self.lbl_state = QLabel("Disconnected")
-        f = QFont(); f.setPointSize(16); f.setBold(True)
-        self.lbl_state.setFont(f)
-        self.lbl_state.setStyleSheet("color: #b00020;")
+        self.lbl_state.setFont(_font(16, True))
+        # parsed once; on_connection_changed only flips the "state" property
+        self.lbl_state.setStyleSheet(_STATE_STYLE)
+        self.lbl_state.setProperty("state", "disconnected")
 
         self.btn_connect = QPushButton("Connect")
         self.btn_disconnect = QPushButton("Disconnect")
@@ -683,11 +781,19 @@ class ConnectionPage(QWidget):
         
         outer.addLayout(conn_row)
         
-        self.text = QTextEdit()
+        self.text = QPlainTextEdit()
         self.text.setReadOnly(True)
         self.text.setPlaceholderText("Connection log")
+        self.text.setMaximumBlockCount(5000)
         outer.addWidget(self.text, 1)
 
+        # log lines are buffered and appended in one go at most every 50 ms
+        self._log_buf = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+
         action_row = QHBoxLayout()
         self.btn_start = QPushButton("Do Science!")
         self.btn_pause = QPushButton("Pause")
@@ -701,7 +807,7 @@ class ConnectionPage(QWidget):
         nav = QHBoxLayout()
         nav.addStretch(1)
         self.btn_back = QPushButton("Back")
-        self.btn_back.clicked.connect(lambda: self.mw.go("Summary"))
+        self.btn_back.clicked.connect(partial(self.mw.go, "Summary"))
         nav.addWidget(self.btn_back)
         outer.addLayout(nav)
 
@@ -729,17 +835,26 @@ class ConnectionPage(QWidget):
     def on_connection_changed(self, connected: bool) -> None:
         if connected:
             self.lbl_state.setText("Connected")
-            self.lbl_state.setStyleSheet("color: #1b7f3a;")
+            self._set_state_style("connected")
             self.btn_connect.setEnabled(False)
             self.btn_disconnect.setEnabled(True)
         else:
             self.lbl_state.setText("Disconnected")
-            self.lbl_state.setStyleSheet("color: #b00020;")
+            self._set_state_style("disconnected")
             self.btn_connect.setEnabled(True)
             self.btn_disconnect.setEnabled(False)
 
+    def _set_state_style(self, state: str) -> None:
+        self.lbl_state.setProperty("state", state)
+        style = self.lbl_state.style()
+        style.unpolish(self.lbl_state)
+        style.polish(self.lbl_state)
+
     @Slot()
     def _start(self) -> None:
+        if self.mw.machine_busy():
+            self.controller.log("Busy: wait for the current machine action to finish")
+            return
         self.controller.start_drawing()
 
     @Slot(bool)
@@ -755,7 +870,14 @@ class ConnectionPage(QWidget):
     
     @Slot(str)
     def append_log(self, msg: str) -> None:
-        self.text.append(msg)
+        self._log_buf.append(msg)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    @Slot()
+    def _flush_log(self) -> None:
+        self.text.appendPlainText("\n".join(self._log_buf))
+        self._log_buf.clear()
 
 
 '''class LogPage(QWidget):